@@ -2,10 +2,14 @@ import gspread
 from oauth2client.service_account import ServiceAccountCredentials
 from datetime import datetime
 import json
+import re
+
+from order_events import publish_order_placed
 
 GOOGLE_SHEETS_CREDS_FILE = "credentials.json"  # Path to your Google service account JSON
 GOOGLE_SHEET_NAME = "order_management_system"  # Name of your Google Sheet for menu
 # ORDERS_SHEET_NAME = "Hotel Orders"
+STATUS_COLUMN = "H"  # Order status, written as "Pending" by save_order_to_sheet
 
 scope = ['https://spreadsheets.google.com/feeds',
          'https://www.googleapis.com/auth/drive']
@@ -65,12 +69,87 @@ def save_order_to_sheet(order_details: dict):
             "Pending"
         ]
 
-        sheet.append_row(order_row)
+        response = sheet.append_row(order_row)
+        publish_order_placed(order_details, get_appended_row_number(response))
         return True
     except Exception as e:
         print(f"Error saving order: {str(e)}")
         return False
 
+def get_orders_worksheet(refresh: bool = False):
+    """Open the orders worksheet once and reuse it, refresh re-reads properties such as row_count"""
+    global orders_spreadsheet, orders_worksheet
+    if orders_spreadsheet is None:
+        orders_spreadsheet = client.open(GOOGLE_SHEET_NAME)
+    if orders_worksheet is None or refresh:
+        orders_worksheet = orders_spreadsheet.get_worksheet(1)
+    return orders_worksheet
+
+orders_spreadsheet = None
+orders_worksheet = None
+
+def get_order_statuses(start_row: int = 2):
+    """Read the timestamp, phone and status columns from start_row down, returns {row_number: (timestamp, phone, status)}"""
+    if not client:
+        return None
+
+    sheet = get_orders_worksheet()
+    if start_row > sheet.row_count:
+        # The grid may have grown since it was opened
+        sheet = get_orders_worksheet(refresh=True)
+        if start_row > sheet.row_count:
+            return {}
+
+    timestamps, phones, statuses = sheet.batch_get(
+        [f"A{start_row}:A", f"C{start_row}:C", f"{STATUS_COLUMN}{start_row}:{STATUS_COLUMN}"])
+
+    def cell(values, index):
+        return values[index][0] if index < len(values) and values[index] else ""
+
+    return {start_row + index: (cell(timestamps, index), cell(phones, index), cell(statuses, index))
+            for index in range(max(len(timestamps), len(phones), len(statuses)))}
+
+CONTACT_PAGE_SIZE = 1000  # Rows per range when reading contacts
+CONTACT_RANGES_PER_REQUEST = 5  # Ranges per batch_get call when reading contacts
+
+def get_order_contacts(row_numbers):
+    """Read timestamp, name, phone and room for the given rows, paged into batch requests"""
+    if not client or not row_numbers:
+        return {}
+
+    # Consecutive rows are fetched as one range, capped at CONTACT_PAGE_SIZE rows
+    runs = []
+    for row_number in sorted(set(row_numbers)):
+        if runs and runs[-1][1] == row_number - 1 and row_number - runs[-1][0] < CONTACT_PAGE_SIZE:
+            runs[-1][1] = row_number
+        else:
+            runs.append([row_number, row_number])
+
+    sheet = get_orders_worksheet()
+    contacts = {}
+    for batch_start in range(0, len(runs), CONTACT_RANGES_PER_REQUEST):
+        batch = runs[batch_start:batch_start + CONTACT_RANGES_PER_REQUEST]
+        value_ranges = sheet.batch_get([f"A{first}:D{last}" for first, last in batch])
+        for (first, last), value_range in zip(batch, value_ranges):
+            for offset in range(last - first + 1):
+                row = list(value_range[offset]) if offset < len(value_range) else []
+                row += [""] * (4 - len(row))
+                contacts[first + offset] = {
+                    "timestamp": row[0],
+                    "customer_name": row[1],
+                    "phone_number": row[2],
+                    "room_number": row[3]
+                }
+    return contacts
+
+def get_appended_row_number(response):
+    """Extract the row number from an append_row API response"""
+    try:
+        updated_range = response["updates"]["updatedRange"]
+        return int(re.search(r"[A-Z]+(\d+)", updated_range.split("!")[-1]).group(1))
+    except Exception:
+        return None
+
 if __name__ == "__main__":
     sheet = client.open(GOOGLE_SHEET_NAME).get_worksheet(1)
     sheet.append_row([1,2,3,4,5,6,7,8])
@@ -5,7 +5,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langgraph.graph import StateGraph, END
 
-from llm_handler.tools import get_menu, get_item_details, place_order
+from llm_handler.tools import get_menu, get_item_details, place_order, get_order_status
 from dotenv import load_dotenv
 
 
@@ -47,6 +47,7 @@ def call_model(state: AgentState):
         1. Help customers view the menu
         2. Answer questions about menu items
         3. Take orders and save them to the system
+        4. Tell customers the status of their orders
 
         Be friendly, concise, and helpful. When taking orders, make sure to collect:
         - Customer name
@@ -57,7 +58,7 @@ def call_model(state: AgentState):
         Use the available tools to fetch menu information and place orders.""")
         messages = [system_message] + messages
 
-    response = llm.bind_tools([get_menu, get_item_details, place_order]).invoke(messages)
+    response = llm.bind_tools([get_menu, get_item_details, place_order, get_order_status]).invoke(messages)
     return {"messages": [response]}
 
 
@@ -69,13 +70,18 @@ def call_tools(state: AgentState):
     tool_mapping = {
         "get_menu": get_menu,
         "get_item_details": get_item_details,
-        "place_order": place_order
+        "place_order": place_order,
+        "get_order_status": get_order_status
     }
 
     tool_messages = []
     for tool_call in last_message.tool_calls:
         tool = tool_mapping[tool_call["name"]]
-        result = tool.invoke(tool_call["args"])
+        args = dict(tool_call["args"])
+        if tool_call["name"] in ("place_order", "get_order_status"):
+            # Always the sender's WhatsApp address, never a number chosen by the model
+            args["phone_number"] = state["user_info"].get("phone_number", "")
+        result = tool.invoke(args)
         tool_messages.append({
             "role": "tool",
             "content": result,
@@ -1,5 +1,7 @@
 from google_sheet_handler import save_order_to_sheet, get_menu_text_from_sheet, get_menu_from_sheet
-from langchain_core.tools import tool
+from order_status import find_orders_by_phone
+from langchain_core.tools import tool, InjectedToolArg
+from typing import Annotated
 import json
 
 @tool
@@ -8,14 +10,15 @@ def get_menu() -> str:
     return get_menu_text_from_sheet()
 
 @tool
-def place_order(customer_name: str, phone_number: str, room_number: str,
-                items: list[dict], special_instructions: str = "") -> str:
+def place_order(customer_name: str, room_number: str, items: list[dict],
+                phone_number: Annotated[str, InjectedToolArg],
+                special_instructions: str = "") -> str:
     """
     Place an order for the customer.
 
     Args:
         customer_name: Customer's name
-        phone_number: Customer's phone number
+        phone_number: Customer's WhatsApp address, filled in from the incoming message
         room_number: Hotel room number
         items: JSON string of ordered items with quantities (e.g., '[{"item": "Burger", "quantity": 2}, {"item": "Fries", "quantity": 1}]')
         special_instructions: Any special requests
@@ -82,4 +85,16 @@ def get_item_details(item_name: str) -> str:
 
         return f"Item '{item_name}' not found in menu."
     except Exception as e:
-        return f"Error: {str(e)}"
\ No newline at end of file
+        return f"Error: {str(e)}"
+
+@tool
+def get_order_status(phone_number: Annotated[str, InjectedToolArg]) -> str:
+    """Get the current status of the customer's orders."""
+    matches = find_orders_by_phone(phone_number)
+    if not matches:
+        return "No orders found for you."
+
+    status_text = "📦 Your orders:\n"
+    for timestamp, order in matches[:5]:
+        status_text += f"  - Room {order.get('room_number', '')}: {order.get('status', '')}\n"
+    return status_text
\ No newline at end of file
@@ -5,7 +5,42 @@ from llm_handler.llm import graph
 
 app = FastAPI(title="Hotel WhatsApp Chatbot")
 user_sessions = {}
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Request, Response, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import os
+import re
+import secrets
+
+from order_events import order_event_bus, format_sse
+from order_status import order_status_sync
+from reporting import iter_orders, iter_csv, iter_ndjson, build_report
+from whatsapp import outbound_sender
+
+ORDERS_API_TOKEN = os.getenv("ORDERS_API_TOKEN")  # Shared token for the staff order endpoints
+
+def require_api_token(request: Request):
+    """Allow only staff holding ORDERS_API_TOKEN (header, bearer or ?token= for EventSource)"""
+    if not ORDERS_API_TOKEN:
+        raise HTTPException(status_code=503, detail="ORDERS_API_TOKEN is not configured")
+
+    token = request.headers.get("X-API-Key") or request.query_params.get("token") or ""
+    authorization = request.headers.get("Authorization", "")
+    if authorization.startswith("Bearer "):
+        token = authorization[len("Bearer "):]
+    if not secrets.compare_digest(token.encode(), ORDERS_API_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing API token")
+
+@app.on_event("startup")
+def start_background_workers():
+    """Start the order status sync and the WhatsApp notification sender"""
+    outbound_sender.start()
+    order_status_sync.start()
+
+@app.on_event("shutdown")
+def stop_background_workers():
+    order_status_sync.stop()
+    outbound_sender.stop()
 
 @app.post("/webhook")
 async def whatsapp_webhook(request: Request):
@@ -28,8 +63,8 @@ async def whatsapp_webhook(request: Request):
     # Add user message to session
     session["messages"].append(HumanMessage(content=incoming_msg))
 
-    # Run the agent
-    result = graph.invoke({
+    # Run the agent off the event loop so the order feed keeps streaming meanwhile
+    result = await run_in_threadpool(graph.invoke, {
         "messages": session["messages"],
         "user_info": session["user_info"]
     })
@@ -54,6 +89,52 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "WhatsApp Hotel Chatbot"}
 
+@app.get("/orders/stream", dependencies=[Depends(require_api_token)])
+async def orders_stream(request: Request):
+    """Live feed of placed orders and status changes (Server-Sent Events)"""
+    last_event_id = request.headers.get("Last-Event-ID") or request.query_params.get("last_event_id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    async def event_source():
+        async for event in order_event_bus.stream(last_event_id):
+            if await request.is_disconnected():
+                break
+            yield format_sse(event)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def validate_report_date(date: str):
+    if date and not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date):
+        raise HTTPException(status_code=400, detail="date must be YYYY-MM-DD")
+
+@app.get("/orders/export", dependencies=[Depends(require_api_token)])
+def export_orders(format: str = "csv", date: str = None):
+    """Stream all orders (optionally for one YYYY-MM-DD date) as CSV or NDJSON"""
+    validate_report_date(date)
+    if format == "ndjson":
+        return StreamingResponse(iter_ndjson(iter_orders(date)), media_type="application/x-ndjson")
+    if format != "csv":
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+    filename = f"orders_{date}.csv" if date else "orders.csv"
+    return StreamingResponse(
+        iter_csv(iter_orders(date)),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+@app.get("/orders/report", dependencies=[Depends(require_api_token)])
+def orders_report(date: str = None):
+    """Revenue per item, per room and per hour"""
+    validate_report_date(date)
+    return build_report(date)
+
 
 # @app.post("/clear-session/{phone_number}")
 def clear_session(phone_number: str):
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import threading
+from collections import deque
+from datetime import datetime
+
+HISTORY_SIZE = 1000  # Events kept for Last-Event-ID resume
+SUBSCRIBER_BUFFER_SIZE = 100  # Pending events per subscriber before it is dropped
+
+
+class Subscription:
+    """A single stream consumer with its own bounded buffer"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, buffer_size: int):
+        self.loop = loop
+        self.buffer_size = buffer_size
+        self.queue = asyncio.Queue()  # Bounded by offer, leaving room for the sentinel
+        self.overflowed = False
+
+    def offer(self, event: dict):
+        """Queue an event, runs on the subscriber's event loop"""
+        if self.overflowed:
+            return
+        if self.queue.qsize() >= self.buffer_size:
+            # Slow consumer: drop this event and end the stream, every event already
+            # queued is still delivered so resuming from Last-Event-ID loses nothing
+            self.overflowed = True
+            self.queue.put_nowait(None)
+            return
+        self.queue.put_nowait(event)
+
+
+class OrderEventBus:
+    """In-process pub/sub for order events, safe to publish from any thread"""
+
+    def __init__(self, history_size: int = HISTORY_SIZE,
+                 buffer_size: int = SUBSCRIBER_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self.history = deque(maxlen=history_size)
+        self.subscribers = set()
+        self.last_id = 0
+        self.lock = threading.Lock()
+
+    def publish(self, event_type: str, data: dict) -> dict:
+        """Record an event and fan it out to every subscriber"""
+        with self.lock:
+            self.last_id += 1
+            event = {
+                "id": self.last_id,
+                "type": event_type,
+                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "data": data
+            }
+            self.history.append(event)
+            for subscription in list(self.subscribers):
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.offer, event)
+                except RuntimeError:
+                    # Event loop already closed
+                    self.subscribers.discard(subscription)
+        return event
+
+    def subscribe(self, last_event_id: int = None):
+        """Register a subscriber, returns it with any events missed since last_event_id
+
+        When those events can no longer be replayed the backlog is a single
+        "reset" event and the client should reload the current orders.
+        """
+        subscription = Subscription(asyncio.get_running_loop(), self.buffer_size)
+        with self.lock:
+            if last_event_id is None:
+                backlog = []
+            elif last_event_id > self.last_id or (
+                    self.history and last_event_id < self.history[0]["id"] - 1):
+                # Server restarted or the missed events fell out of history,
+                # tell the client to reload instead of resuming with a gap
+                backlog = [{
+                    "id": self.last_id,
+                    "type": "reset",
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "data": {"last_event_id": last_event_id}
+                }]
+            else:
+                backlog = [event for event in self.history if event["id"] > last_event_id]
+            self.subscribers.add(subscription)
+        return subscription, backlog
+
+    def unsubscribe(self, subscription: Subscription):
+        with self.lock:
+            self.subscribers.discard(subscription)
+
+    async def stream(self, last_event_id: int = None, heartbeat: float = 15.0):
+        """Yield events (or None as a keep-alive) until the subscriber falls behind"""
+        subscription, backlog = self.subscribe(last_event_id)
+        try:
+            for event in backlog:
+                yield event
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                yield event
+        finally:
+            self.unsubscribe(subscription)
+
+
+def format_sse(event: dict) -> str:
+    """Render an event in text/event-stream format"""
+    if event is None:
+        return ": keep-alive\n\n"
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+
+
+order_event_bus = OrderEventBus()
+
+
+def publish_order_placed(order_details: dict, row_number: int = None):
+    """Announce a newly placed order"""
+    return order_event_bus.publish("order_placed", {
+        "row": row_number,
+        "customer_name": order_details.get("customer_name", ""),
+        "room_number": order_details.get("room_number", ""),
+        "items": order_details.get("items", []),
+        "total_amount": order_details.get("total_amount", 0),
+        "special_instructions": order_details.get("special_instructions", ""),
+        "status": "Pending"
+    })
+
+
+def publish_status_change(row_number: int, old_status: str, new_status: str, order: dict = None):
+    """Announce an order status change"""
+    order = order or {}
+    return order_event_bus.publish("status_changed", {
+        "row": row_number,
+        "customer_name": order.get("customer_name", ""),
+        "room_number": order.get("room_number", ""),
+        "old_status": old_status,
+        "status": new_status
+    })
@@ -0,0 +1,137 @@
+import os
+import threading
+
+from google_sheet_handler import get_order_statuses, get_order_contacts
+from order_events import publish_status_change
+from whatsapp import outbound_sender, to_whatsapp_address
+
+SYNC_INTERVAL = float(os.getenv("ORDER_STATUS_SYNC_INTERVAL", "30"))  # Seconds between status reads
+TERMINAL_STATUSES = {"delivered", "cancelled"}  # Orders that will not change again
+SYNC_MARGIN = 100  # Rows re-read above the oldest open order, in case rows above it were deleted
+FULL_RESYNC_EVERY = 20  # Every Nth sync re-reads the key and status columns from the top
+
+# Local copy of the orders sheet keyed on (timestamp, phone_number), which survives
+# rows being inserted, deleted or sorted, {key: {"row", "status", "customer_name", "phone_number", "room_number"}}
+orders = {}
+orders_lock = threading.Lock()
+
+# Polling only reads from start_row down, just above the oldest order still open
+sync_state = {"loaded": False, "start_row": 2, "syncs": 0}
+
+
+def status_message(order: dict, status: str) -> str:
+    message = f"🔔 Order update for room {order['room_number']}: your order is now *{status}*."
+    if order.get("customer_name"):
+        message = f"Hi {order['customer_name']}! " + message
+    return message
+
+
+def is_open(status: str) -> bool:
+    return status.strip().lower() not in TERMINAL_STATUSES
+
+
+def sync_order_statuses():
+    """Read the key and status columns of recent rows, notify guests whose order status changed, returns changed keys"""
+    full_sync = not sync_state["loaded"] or sync_state["syncs"] % FULL_RESYNC_EVERY == 0
+    start_row = 2 if full_sync else sync_state["start_row"]
+    rows = get_order_statuses(start_row)
+    if rows is None:
+        return []
+    sync_state["syncs"] += 1
+
+    statuses = {}
+    key_rows = {}
+    for row, (timestamp, phone_number, status) in rows.items():
+        if not timestamp:
+            continue
+        key = (timestamp, phone_number)
+        statuses[key] = status
+        key_rows[key] = row
+
+    with orders_lock:
+        new_keys = [key for key in statuses if key not in orders]
+        changed_keys = [key for key, status in statuses.items()
+                        if key in orders and orders[key]["status"] != status]
+
+    # Only orders we have never seen need their name and room read
+    contacts = get_order_contacts([key_rows[key] for key in new_keys])
+
+    notifications = []
+    with orders_lock:
+        for key in list(orders):
+            # Orders above the window were not read this time and are kept
+            if key not in statuses and orders[key]["row"] >= start_row:
+                del orders[key]
+        for key in new_keys:
+            contact = contacts.get(key_rows[key], {})
+            # The row may have moved between the two reads, pick it up next sync
+            if (contact.get("timestamp"), contact.get("phone_number")) != key:
+                continue
+            orders[key] = {
+                "row": key_rows[key],
+                "status": statuses[key],
+                "customer_name": contact["customer_name"],
+                "phone_number": contact["phone_number"],
+                "room_number": contact["room_number"]
+            }
+        for key in changed_keys:
+            old_status = orders[key]["status"]
+            orders[key]["status"] = statuses[key]
+            notifications.append((key_rows[key], old_status, dict(orders[key])))
+        for key, row in key_rows.items():
+            if key in orders:
+                orders[key]["row"] = row
+
+        open_rows = [order["row"] for order in orders.values() if is_open(order["status"])]
+        next_row = min(open_rows) if open_rows else max(rows, default=start_row - 1) + 1
+        sync_state["start_row"] = max(2, next_row - SYNC_MARGIN)
+
+    for row, old_status, order in notifications:
+        publish_status_change(row, old_status, order["status"], order)
+        if order.get("phone_number"):
+            outbound_sender.send(order["phone_number"], status_message(order, order["status"]))
+
+    if not sync_state["loaded"]:
+        sync_state["loaded"] = True
+        print(f"Order status sync: loaded {len(orders)} orders")
+    return changed_keys
+
+
+def find_orders_by_phone(phone_number: str):
+    """Orders placed from exactly this WhatsApp number, most recent first"""
+    address = to_whatsapp_address(phone_number)
+    if not address:
+        return []
+    with orders_lock:
+        matches = [(key[0], dict(order)) for key, order in orders.items()
+                   if to_whatsapp_address(order.get("phone_number", "")) == address]
+    return sorted(matches, key=lambda match: match[0], reverse=True)
+
+
+class OrderStatusSync:
+    """Runs sync_order_statuses on a background thread"""
+
+    def __init__(self, interval: float = SYNC_INTERVAL):
+        self.interval = interval
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, name="order-status-sync", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                sync_order_statuses()
+            except Exception as e:
+                print(f"Error syncing order statuses: {str(e)}")
+            self.stopped.wait(self.interval)
+
+
+order_status_sync = OrderStatusSync()
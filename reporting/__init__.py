@@ -0,0 +1,179 @@
+import csv
+import io
+import json
+
+from google_sheet_handler import client, get_orders_worksheet, get_menu_from_sheet
+
+PAGE_SIZE = 1000  # Rows per range
+RANGES_PER_REQUEST = 5  # Ranges fetched per batch_get call
+
+ORDER_COLUMNS = ["timestamp", "customer_name", "phone_number", "room_number",
+                 "items", "total_amount", "special_instructions", "status"]
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")  # Cells a spreadsheet would run as a formula
+CSV_COLUMNS = ["timestamp", "customer_name", "phone_number", "room_number",
+               "item", "quantity", "total_amount", "special_instructions", "status"]
+
+
+def iter_order_rows(page_size: int = PAGE_SIZE, ranges_per_request: int = RANGES_PER_REQUEST):
+    """Yield raw order rows page by page, without loading the whole sheet
+
+    Pages are bounded by the worksheet's row_count rather than by the first short
+    page, since the API trims trailing blank rows from every range.
+    """
+    if not client:
+        return
+
+    sheet = get_orders_worksheet(refresh=True)
+    last_row = sheet.row_count
+    start = 2  # Skip the header row
+    while start <= last_row:
+        ranges = []
+        for page in range(ranges_per_request):
+            first = start + page * page_size
+            if first > last_row:
+                break
+            ranges.append(f"A{first}:H{min(first + page_size - 1, last_row)}")
+        for value_range in sheet.batch_get(ranges):
+            yield from value_range
+        start += ranges_per_request * page_size
+
+
+def parse_orders(rows, date: str = None):
+    """Turn raw rows into order dicts with the items JSON decoded"""
+    for row in rows:
+        if not row:
+            continue
+        order = dict(zip(ORDER_COLUMNS, list(row) + [""] * (len(ORDER_COLUMNS) - len(row))))
+        if date and not order["timestamp"].startswith(date):
+            continue
+        order["items"] = parse_items(order["items"])
+        order["total_amount"] = to_number(order["total_amount"])
+        yield order
+
+
+def parse_items(items_json: str):
+    """Decode the items column into a list of item dicts, skipping anything hand-edited into another shape"""
+    try:
+        items = json.loads(items_json) if items_json else []
+    except ValueError:
+        return []
+    if isinstance(items, dict):
+        items = [items]
+    if not isinstance(items, list):
+        return []
+    return [item for item in items if isinstance(item, dict)]
+
+
+def iter_orders(date: str = None):
+    return parse_orders(iter_order_rows(), date)
+
+
+def to_number(value):
+    try:
+        return float(str(value).replace(",", "").replace("₹", "").strip() or 0)
+    except ValueError:
+        return 0.0
+
+
+def csv_cell(value):
+    """Neutralize guest-supplied text that Excel or Sheets would evaluate as a formula"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(orders, flush_every: int = 500):
+    """Stream orders as CSV, one line per ordered item
+
+    total_amount is the order total and is only filled on the first line of each
+    order, so the column can be summed for reconciliation.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    for count, order in enumerate(orders, start=1):
+        lines = order["items"] or [{}]
+        for line, item in enumerate(lines):
+            writer.writerow([csv_cell(value) for value in [
+                order["timestamp"],
+                order["customer_name"],
+                order["phone_number"],
+                order["room_number"],
+                item.get("item", ""),
+                item.get("quantity", ""),
+                order["total_amount"] if line == 0 else "",
+                order["special_instructions"],
+                order["status"]
+            ]])
+        if count % flush_every == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(orders):
+    """Stream orders as newline-delimited JSON, one object per order"""
+    for order in orders:
+        yield json.dumps(order, ensure_ascii=False) + "\n"
+
+
+class OrderReport:
+    """Running aggregates over a stream of orders, memory grows only with distinct keys"""
+
+    def __init__(self, menu_prices: dict = None):
+        self.menu_prices = menu_prices or {}
+        self.order_count = 0
+        self.total_revenue = 0.0
+        self.items = {}
+        self.rooms = {}
+        self.hours = {}
+        self.unpriced = {"quantity": 0, "items": set()}
+
+    def add(self, order: dict):
+        self.order_count += 1
+        self.total_revenue += order["total_amount"]
+
+        room = self.rooms.setdefault(str(order["room_number"]), {"orders": 0, "revenue": 0.0})
+        room["orders"] += 1
+        room["revenue"] += order["total_amount"]
+
+        hour = self.hours.setdefault(order["timestamp"][:13] + ":00", {"orders": 0, "revenue": 0.0})
+        hour["orders"] += 1
+        hour["revenue"] += order["total_amount"]
+
+        for item in order["items"]:
+            name = str(item.get("item", "")).strip()
+            quantity = to_number(item.get("quantity", 0))
+            stats = self.items.setdefault(name.lower(), {"item": name, "quantity": 0, "revenue": 0.0,
+                                                         "priced": name.lower() in self.menu_prices})
+            stats["quantity"] += quantity
+            if stats["priced"]:
+                stats["revenue"] += quantity * self.menu_prices[name.lower()]
+            else:
+                # Not on today's menu, its share of revenue cannot be attributed
+                self.unpriced["quantity"] += quantity
+                self.unpriced["items"].add(name)
+
+    def to_dict(self):
+        return {
+            "orders": self.order_count,
+            "revenue": self.total_revenue,
+            "revenue_per_item": sorted(self.items.values(), key=lambda stats: -stats["revenue"]),
+            "revenue_per_room": self.rooms,
+            "revenue_per_hour": dict(sorted(self.hours.items())),
+            "unpriced": {"quantity": self.unpriced["quantity"], "items": sorted(self.unpriced["items"])}
+        }
+
+
+def build_report(date: str = None):
+    """Aggregate all orders (optionally for one YYYY-MM-DD date) in a single pass"""
+    menu_data = get_menu_from_sheet()
+    menu_prices = {}
+    if isinstance(menu_data, list):
+        menu_prices = {str(item['Item']).lower(): to_number(item['Price']) for item in menu_data}
+
+    report = OrderReport(menu_prices)
+    for order in iter_orders(date):
+        report.add(order)
+    return report.to_dict()
@@ -0,0 +1,133 @@
+import os
+import queue
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+TWILIO_WHATSAPP_NUMBER = os.getenv("TWILIO_WHATSAPP_NUMBER", "whatsapp:+14155238886")
+DEFAULT_COUNTRY_CODE = os.getenv("DEFAULT_COUNTRY_CODE", "")  # e.g. "91", used for numbers without one
+
+try:
+    from twilio.rest import Client
+    twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN) if TWILIO_ACCOUNT_SID else None
+except Exception:
+    twilio_client = None
+if twilio_client is None:
+    print("Warning: Twilio credentials not found. Please set TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN")
+
+
+def to_whatsapp_address(phone_number: str):
+    """Normalize a phone number to a whatsapp:+E.164 address, None if that is not possible"""
+    number = str(phone_number).strip()
+    if number.startswith("whatsapp:"):
+        number = number[len("whatsapp:"):]
+    digits = "".join(ch for ch in number if ch.isdigit())
+
+    if number.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif DEFAULT_COUNTRY_CODE:
+        digits = DEFAULT_COUNTRY_CODE + digits.lstrip("0")
+    else:
+        return None
+
+    if not 8 <= len(digits) <= 15:
+        return None
+    return f"whatsapp:+{digits}"
+
+
+class OutboundSender:
+    """Background WhatsApp sender that batches queued messages and respects a send rate"""
+
+    def __init__(self, messages_per_second: float = 1.0, batch_size: int = 20,
+                 flush_interval: float = 2.0):
+        self.interval = 1.0 / messages_per_second
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.thread = None
+        self.stopped = threading.Event()
+        self.last_sent = 0.0
+        self.in_flight = 0  # Messages taken off the queue but not yet delivered
+
+    def send(self, phone_number: str, body: str):
+        """Queue a message, it is delivered by the background thread"""
+        to = to_whatsapp_address(phone_number)
+        if not to:
+            print(f"WhatsApp message not queued, invalid phone number: {phone_number}")
+            return
+        self.queue.put((to, body))
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, name="whatsapp-sender", daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the sender, delivering what is still queued for up to timeout seconds"""
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+        discarded = self.queue.qsize() + self.in_flight
+        if discarded:
+            print(f"WhatsApp sender stopped, {discarded} queued messages discarded")
+
+    def run(self):
+        # After stop, keep going until the queue is drained
+        while not self.stopped.is_set() or not self.queue.empty():
+            batch = self.next_batch()
+            if batch:
+                self.in_flight = len(batch)
+                self.flush(batch)
+
+    def next_batch(self):
+        """Wait for a message, then collect whatever else arrives within flush_interval"""
+        try:
+            batch = [self.queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self, batch):
+        # One message per recipient, several updates are joined together
+        combined = {}
+        for to, body in batch:
+            combined.setdefault(to, []).append(body)
+
+        for to, bodies in combined.items():
+            wait = self.last_sent + self.interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self.deliver(to, "\n\n".join(bodies))
+            self.last_sent = time.monotonic()
+            self.in_flight -= len(bodies)
+
+    def deliver(self, to: str, body: str):
+        if not twilio_client:
+            print(f"WhatsApp message to {to} not sent (Twilio not configured): {body}")
+            return
+        try:
+            twilio_client.messages.create(from_=TWILIO_WHATSAPP_NUMBER, to=to, body=body)
+        except Exception as e:
+            print(f"Error sending WhatsApp message to {to}: {str(e)}")
+
+
+outbound_sender = OutboundSender(
+    messages_per_second=float(os.getenv("WHATSAPP_MESSAGES_PER_SECOND", "1"))
+)